@@ -1,17 +1,41 @@
 #!/usr/bin/env python3
+import io
 import os
 import re
 import sys
+import json
 import time
 import argparse
 import tempfile
+import hashlib
 import uuid
 import shutil
+import subprocess
+import threading
+import multiprocessing
 from pathlib import Path
 from PIL import Image
 from pytesseract import image_to_pdf_or_hocr
 import pikepdf
-from concurrent.futures import ThreadPoolExecutor
+import img2pdf
+import numpy as np
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+try:
+    from tesserocr import PyTessBaseAPI
+except ImportError:
+    PyTessBaseAPI = None
+
+_YYYYMM_RE = re.compile(r'(\d{6})')
+
+# Core scan pages are named NGM_YYYY_MM_...; everything else is an extra.
+_MAIN_PREFIX = 'ngm_'
+
+# CNG is JPEG with every byte XORed by 0xEF; translate() applies the XOR as
+# one C-level table lookup pass for files too small to be worth mmapping.
+_XOR_TABLE = bytes(b ^ 239 for b in range(256))
+_XOR_MMAP_THRESHOLD = 4_000_000
 
 SYMBOLS = {
     'skip': '⏭️',
@@ -24,22 +48,94 @@ SYMBOLS = {
 def convert_cng_to_jpg(src_path, delete=False):
     jpg_path = src_path.with_suffix('.jpg')
     try:
-        with open(src_path, 'rb') as fin, open(jpg_path, 'wb') as fout:
-            fout.write(bytearray((b ^ 239) for b in fin.read()))
+        size = os.path.getsize(src_path)
+        if size == 0:
+            return None
+        if size < _XOR_MMAP_THRESHOLD:
+            with open(src_path, 'rb') as fin, open(jpg_path, 'wb') as fout:
+                fout.write(fin.read().translate(_XOR_TABLE))
+        else:
+            fd = os.open(src_path, os.O_RDONLY)
+            try:
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                src = np.memmap(fd, dtype=np.uint8, mode='r')
+                # XOR straight from the page cache into the mapped output; no
+                # userspace copies of the file, writeback happens asynchronously.
+                out = np.memmap(jpg_path, dtype=np.uint8, mode='w+', shape=src.shape)
+                np.bitwise_xor(src, np.uint8(239), out=out)
+                out.flush()
+                del src, out
+            finally:
+                os.close(fd)
         if delete:
             os.remove(src_path)
         return jpg_path
     except Exception:
         return None
 
-def fast_find_dirs(root):
-    result = []
-    for dirpath, dirnames, _ in os.walk(root):
-        result.append(dirpath)
-    return result
+class MemoryPage:
+    """A CNG page decoded to JPEG bytes in memory, never written to disk."""
+    __slots__ = ('name', 'data')
+
+    def __init__(self, name, data):
+        self.name = name
+        self.data = data
+
+    @property
+    def stem(self):
+        return self.name.rsplit('.', 1)[0]
+
+def convert_cng_to_bytes(src_path):
+    """Decode a CNG straight to JPEG bytes, skipping the on-disk .jpg."""
+    try:
+        with open(src_path, 'rb') as fin:
+            data = fin.read()
+        return data.translate(_XOR_TABLE) if data else None
+    except OSError:
+        return None
+
+def scan_issues(root):
+    """Walk root once, yielding (dirpath, yyyymm) for folders that look like issues.
+
+    Discovery, validity filtering and date extraction happen in the same
+    pass, so batch mode never re-examines a folder it is going to skip.
+    """
+    stack = [str(root)]
+    while stack:
+        dirpath = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    # is_dir() comes from the dirent, so no extra stat per entry
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError:
+            continue
+        match = _YYYYMM_RE.search(os.path.basename(dirpath))
+        if match:
+            yield dirpath, match.group(1)
+
+def load_scan_cache(cache_path, root):
+    """Return the cached folder list if it is still valid for root, else None."""
+    try:
+        with open(cache_path) as f:
+            cache = json.load(f)
+        if cache.get('root') == str(root) and cache.get('mtime') == os.stat(root).st_mtime_ns:
+            return [tuple(item) for item in cache['issues']]
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+def save_scan_cache(cache_path, root, issues):
+    try:
+        with open(cache_path, 'w') as f:
+            json.dump({'root': str(root), 'mtime': os.stat(root).st_mtime_ns, 'issues': issues}, f)
+    except OSError:
+        pass
 
 def extract_yyyymm(foldername):
-    match = re.search(r'(\d{6})', os.path.basename(foldername))
+    match = _YYYYMM_RE.search(os.path.basename(foldername))
     return match.group(1) if match else None
 
 def add_file(p, is_main, main_pages, extras, seen):
@@ -49,104 +145,349 @@ def add_file(p, is_main, main_pages, extras, seen):
         extras.append(p)
     seen.add(p.stem.lower())
 
-def get_image_files(folder_path, delete_cng=False):
+def get_image_files(folder_path, delete_cng=False, persist_jpg=True):
     main_pages = []
     extras = []
     seen = set()
 
-    for entry in sorted(Path(folder_path).iterdir()):
-        if not entry.is_file():
-            continue
-        ext = entry.suffix.lower()
-        name = entry.name
-        stem = entry.stem.lower()
-        if stem in seen:
+    # scandir's dirent already knows the entry type, so no stat per file
+    with os.scandir(folder_path) as it:
+        entries = sorted((e for e in it if e.is_file(follow_symlinks=False)), key=lambda e: e.name)
+    names = {e.name.lower() for e in entries}
+
+    for entry in entries:
+        name_lower = entry.name.lower()
+        stem, dot, ext = name_lower.rpartition('.')
+        if not dot or stem in seen:
             continue
-        if ext == '.jpg':
-            add_file(entry, name.lower().startswith('ngm_'), main_pages, extras, seen)
-        elif ext == '.cng':
-            converted = convert_cng_to_jpg(entry, delete=delete_cng)
-            if converted and converted.stem.lower() not in seen:
-                add_file(converted, converted.name.lower().startswith('ngm_'), main_pages, extras, seen)
+        if ext == 'jpg':
+            add_file(Path(entry.path), name_lower.startswith(_MAIN_PREFIX), main_pages, extras, seen)
+        elif ext == 'cng':
+            # A prior run already produced the sibling .jpg: reuse it (its
+            # own entry adds it later in the sorted walk). With --remove we
+            # still reconvert so the CNG is only deleted after a decode that
+            # is known to be complete.
+            if stem + '.jpg' in names and not delete_cng:
+                continue
+            if persist_jpg:
+                converted = convert_cng_to_jpg(Path(entry.path), delete=delete_cng)
+                if converted and converted.stem.lower() not in seen:
+                    add_file(converted, name_lower.startswith(_MAIN_PREFIX), main_pages, extras, seen)
+            else:
+                decoded = convert_cng_to_bytes(Path(entry.path))
+                if decoded is not None:
+                    page = MemoryPage(entry.name[:-4] + '.jpg', decoded)
+                    add_file(page, name_lower.startswith(_MAIN_PREFIX), main_pages, extras, seen)
+
+    # entries was sorted by name and both lists append in that order, so the
+    # per-section sorts would be no-ops; return the concatenation directly.
+    return main_pages + extras
+
+_OCR_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'ngb_binder', 'ocr')
+
+def ocr_cache_key(img_path):
+    """Content hash of a page image, used to key its OCR'd one-page PDF."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(img_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def ocr_cache_get(key, dest):
+    src = os.path.join(_OCR_CACHE_DIR, key + '.pdf')
+    try:
+        try:
+            os.link(src, dest)
+        except OSError:
+            if not os.path.exists(src):
+                return False
+            shutil.copyfile(src, dest)
+        return True
+    except OSError:
+        return False
+
+def ocr_cache_put(key, part_path):
+    try:
+        os.makedirs(_OCR_CACHE_DIR, exist_ok=True)
+        tmp = os.path.join(_OCR_CACHE_DIR, f'.{key}.{uuid.uuid4().hex[:8]}.tmp')
+        try:
+            os.link(part_path, tmp)
+        except OSError:
+            shutil.copyfile(part_path, tmp)
+        os.replace(tmp, os.path.join(_OCR_CACHE_DIR, key + '.pdf'))
+    except OSError:
+        pass
 
-    return sorted(main_pages) + sorted(extras)
+_TESS_LOCAL = threading.local()
+
+def ocr_page_to_pdf(img_path):
+    """Return one-page PDF bytes with a text layer for img_path.
+
+    Uses an in-process libtesseract API when tesserocr is installed, so a
+    worker loads the trained data once instead of fork+exec'ing the
+    tesseract binary per page. The API handle is thread-local because
+    libtesseract instances are not safe to share across threads. Falls back
+    to pytesseract otherwise.
+    """
+    if PyTessBaseAPI is not None:
+        try:
+            api = getattr(_TESS_LOCAL, 'api', None)
+            if api is None:
+                api = _TESS_LOCAL.api = PyTessBaseAPI()
+            api.SetImageFile(str(img_path))
+            return api.GetPDFText(0)
+        except Exception:
+            pass
+    return image_to_pdf_or_hocr(str(img_path), extension='pdf')
 
 def pdf_has_ocr(pdf_path):
     try:
         with pikepdf.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                if '/Font' in page.get('/Resources', {}):
-                    return True
+            # Tesseract output is all-or-nothing: if the first page carries
+            # no text layer, none of them do, so one page answers the check.
+            if len(pdf.pages):
+                return '/Font' in pdf.pages[0].get('/Resources', {})
     except Exception:
         pass
     return False
 
-def build_pdf(images, output_path, ocr=False, fail_log=None, verbose=False):
+def staging_path(output_path):
+    """Pick where to serialize the PDF before the final atomic rename.
+
+    When the output directory sits on a different filesystem than the local
+    temp dir (typically NFS/SMB archives), build the PDF locally so the many
+    small writes of serialization don't each pay a network round trip; the
+    finished file is then streamed to the target in one move.
+    """
+    try:
+        out_dev = os.stat(os.path.dirname(output_path) or '.').st_dev
+        if out_dev != os.stat(tempfile.gettempdir()).st_dev:
+            return os.path.join(tempfile.gettempdir(), f"ngb_{uuid.uuid4().hex[:8]}.pdf")
+    except OSError:
+        pass
+    return output_path + ".chk"
+
+def finalize_pdf(staged, output_path):
+    # Flush data before the rename so the replace is atomic on disk too;
+    # a crash either leaves the old file or the complete new one.
+    fd = os.open(staged, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
     temp_output = output_path + ".chk"
+    if staged != temp_output:
+        shutil.move(staged, temp_output)
+    os.replace(temp_output, output_path)
+
+def build_pdf(images, output_path, ocr=False, fail_log=None, verbose=False, ocr_workers=1):
+    staged = staging_path(output_path)
     if not images:
         return ['NO_IMAGES']
+    prefetch_pages(images)
 
     if not ocr:
-        image_objs = []
-        for f in images:
+        # Embed the JPEG streams directly (no decode/re-encode); fall back to
+        # PIL only if img2pdf rejects a malformed file.
+        try:
+            with open(staged, 'wb') as f:
+                f.write(img2pdf.convert(
+                    [p.data if isinstance(p, MemoryPage) else str(p) for p in images]))
+            finalize_pdf(staged, output_path)
+            return []
+        except Exception as e:
+            if verbose:
+                print(f"[WARNING] img2pdf failed ({e}), retrying with PIL")
+
+        # Encode one page at a time and merge with pikepdf so only a few
+        # decoded bitmaps are resident at any moment, instead of every page
+        # of the issue at once. A small thread pool prefetches decodes
+        # (libjpeg releases the GIL) so page N+1 is ready while page N is
+        # being serialized; the deque bounds how far decode runs ahead.
+        def decode(f):
+            im = Image.open(io.BytesIO(f.data) if isinstance(f, MemoryPage) else f)
+            im.load()
+            if im.mode != 'RGB':
+                im = im.convert("RGB")
+            return im
+
+        merged = pikepdf.Pdf.new()
+        sources = []
+
+        def append_page(f, future):
             try:
-                with Image.open(f) as im:
-                    image_objs.append(im.convert("RGB"))
+                im = future.result()
             except Exception as e:
                 if verbose:
                     print(f"[ERROR] Failed to load image {f}: {e}")
-        if image_objs:
+                return
+            page_buf = io.BytesIO()
+            im.save(page_buf, format='PDF')
+            im.close()
+            src = pikepdf.open(page_buf)
+            merged.pages.extend(src.pages)
+            sources.append(src)
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1)) as pool:
+                pending = deque()
+                for f in images:
+                    pending.append((f, pool.submit(decode, f)))
+                    if len(pending) >= 4:
+                        append_page(*pending.popleft())
+                while pending:
+                    append_page(*pending.popleft())
+            if not sources:
+                return ['IMAGE_OPEN_FAIL']
             try:
-                image_objs[0].save(temp_output, save_all=True, append_images=image_objs[1:], format='PDF')
-                os.rename(temp_output, output_path)
+                merged.save(staged)
+                finalize_pdf(staged, output_path)
                 return []
             except Exception as e:
                 if verbose:
                     print(f"[ERROR] Failed to write PDF: {e}")
                 return ['WRITE_ERROR']
-        return ['IMAGE_OPEN_FAIL']
+        finally:
+            for src in sources:
+                src.close()
 
-    # OCR path
-    ocr_tempdir = os.path.join(os.path.dirname(output_path), f"ocr_{uuid.uuid4().hex[:8]}")
-    os.makedirs(ocr_tempdir, exist_ok=True)
-    failed_ocr = 0
+    # OCR path — part files are staged locally for the same reason
+    ocr_tempdir = tempfile.mkdtemp(prefix=f"ocr_{uuid.uuid4().hex[:8]}_")
+
+    # One tesseract run per issue: the CLI accepts a page-list file and
+    # produces the multi-page PDF itself, amortizing startup and model load
+    # across the whole issue and skipping the merge step entirely.
+    list_path = os.path.join(ocr_tempdir, 'pages.txt')
+    output_base = os.path.join(ocr_tempdir, 'issue')
+
+    # Content-addressed cache of per-page OCR results: a re-run over pages
+    # that were OCR'd before (e.g. after an interrupted batch) becomes a
+    # file-copy workload instead of a Tesseract workload.
+    try:
+        keys = [ocr_cache_key(p) for p in images]
+    except OSError:
+        keys = None
 
-    for i, img_path in enumerate(images):
+    def part_path(i):
+        return os.path.join(ocr_tempdir, f"{i:03}.pdf")
+
+    all_cached = keys is not None and all(
+        ocr_cache_get(key, part_path(i)) for i, key in enumerate(keys))
+
+    if not all_cached:
         try:
-            pdf_bytes = image_to_pdf_or_hocr(str(img_path), extension='pdf')
-            with open(os.path.join(ocr_tempdir, f"{i:03}.pdf"), 'wb') as f:
-                f.write(pdf_bytes)
-        except Exception as e:
-            print(f"[WARNING] [OCR FAIL] {img_path.name}: {e}")
-            failed_ocr += 1
+            with open(list_path, 'w') as f:
+                f.write('\n'.join(os.path.abspath(str(p)) for p in images) + '\n')
+            subprocess.run(
+                ['tesseract', list_path, output_base, 'pdf'],
+                check=True,
+                stdout=None if verbose else subprocess.DEVNULL,
+                stderr=None if verbose else subprocess.DEVNULL,
+            )
+            finalize_pdf(output_base + '.pdf', output_path)
+            shutil.rmtree(ocr_tempdir)
+            return []
+        except (OSError, subprocess.CalledProcessError) as e:
+            if verbose:
+                print(f"[WARNING] Batch tesseract run failed ({e}), falling back to per-page OCR")
+            # Don't let a partial batch output get swept into the merge below
+            if os.path.exists(output_base + '.pdf'):
+                os.remove(output_base + '.pdf')
+
+    failed_ocr = 0
+
+    def ocr_one(i, img_path):
+        key = keys[i] if keys else None
+        if key and ocr_cache_get(key, part_path(i)):
+            return
+        pdf_bytes = ocr_page_to_pdf(img_path)
+        with open(part_path(i), 'wb') as f:
+            f.write(pdf_bytes)
+        if key:
+            ocr_cache_put(key, part_path(i))
+
+    if all_cached:
+        pass  # every page came from the cache; go straight to the merge
+    elif ocr_workers > 1:
+        # Pages are independent and tesseract is CPU-bound outside the GIL,
+        # so fan the per-page fallback out across threads.
+        with ThreadPoolExecutor(max_workers=min(ocr_workers, len(images))) as pool:
+            futures = {pool.submit(ocr_one, i, p): p for i, p in enumerate(images)}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"[WARNING] [OCR FAIL] {futures[future].name}: {e}")
+                    failed_ocr += 1
+    else:
+        for i, img_path in enumerate(images):
+            try:
+                ocr_one(i, img_path)
+            except Exception as e:
+                print(f"[WARNING] [OCR FAIL] {img_path.name}: {e}")
+                failed_ocr += 1
 
     if verbose:
         print(f"[INFO] OCR completed for {len(images) - failed_ocr}/{len(images)} pages.")
         if failed_ocr:
             print(f"[INFO] Failed OCR pages were skipped but included in the PDF as-is.")
 
+    parts = []
     try:
+        # Parse the part files concurrently — pikepdf releases the GIL in
+        # QPDF's parser — then append in name order so pagination stays
+        # deterministic; sources stay open until save resolves the copies.
+        part_files = sorted(Path(ocr_tempdir).glob("*.pdf"))
+        with ThreadPoolExecutor(max_workers=min(8, max(1, len(part_files)))) as pool:
+            parts = list(pool.map(
+                lambda p: pikepdf.open(p, access_mode=pikepdf.AccessMode.mmap), part_files))
         merger = pikepdf.Pdf.new()
-        for fpath in sorted(Path(ocr_tempdir).glob("*.pdf")):
-            merger.pages.extend(pikepdf.open(fpath).pages)
-        merger.save(temp_output)
+        for src in parts:
+            merger.pages.extend(src.pages)
+        merger.save(staged, linearize=False,
+                    object_stream_mode=pikepdf.ObjectStreamMode.generate)
         merger.close()
-        os.rename(temp_output, output_path)
+        finalize_pdf(staged, output_path)
     except Exception as e:
         print(f"[ERROR] Merging OCR PDFs failed: {e}")
         return ['MERGE_FAIL']
+    finally:
+        for src in parts:
+            src.close()
 
     shutil.rmtree(ocr_tempdir)
     return [] if failed_ocr < len(images) else ['ALL_OCR_FAILED']
 
+def prefetch_pages(paths):
+    """Queue kernel readahead for the pages so decode/OCR doesn't stall on I/O.
+
+    posix_fadvise(WILLNEED) returns immediately; the reads proceed in the
+    background while the first pages are being converted.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for p in paths:
+        if isinstance(p, MemoryPage):
+            continue
+        try:
+            fd = os.open(p, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        except OSError:
+            continue
+
 def print_status(index, total, name, symbol, duration=None):
     time_str = f" [{int(duration // 60):02}:{int(duration % 60):02}]" if duration else ""
     print(f"Processed {index + 1}/{total} - [{name}] - Status: {symbol}{time_str}")
 
-def process_folder(index, folder, total, output_dir, delete_cng, ocr, verbose):
+def process_folder(index, folder, total, output_dir, delete_cng, ocr, verbose, yyyymm=None, ocr_workers=1,
+                   persist_jpg=True):
     start_time = time.time()
     name = os.path.basename(folder)
-    yyyymm = extract_yyyymm(folder)
+    if yyyymm is None:
+        yyyymm = extract_yyyymm(folder)
     if not yyyymm:
         print_status(index, total, name, SYMBOLS['skip'])
         return
@@ -160,38 +501,104 @@ def process_folder(index, folder, total, output_dir, delete_cng, ocr, verbose):
             print_status(index, total, name, SYMBOLS['exist'])
             return
 
-    if os.path.exists(output_file + ".chk"):
-        os.remove(output_file + ".chk")
-
-    images = get_image_files(folder, delete_cng=delete_cng)
+    # OCR needs real files on disk, and --remove without a persisted JPG
+    # would destroy the only copy, so both force the on-disk conversion.
+    images = get_image_files(folder, delete_cng=delete_cng,
+                             persist_jpg=persist_jpg or ocr or delete_cng)
     if not images:
         print_status(index, total, name, SYMBOLS['skip'])
         return
 
-    failed = build_pdf(images, output_file, ocr=ocr, fail_log=None, verbose=verbose)
+    failed = build_pdf(images, output_file, ocr=ocr, fail_log=None, verbose=verbose, ocr_workers=ocr_workers)
     duration = time.time() - start_time
     symbol = SYMBOLS['fail'] if failed else SYMBOLS['done'] + (SYMBOLS['ocr'] if ocr else '')
     print_status(index, total, name, symbol, duration)
 
-def run_batch(root, output_dir, jobs, delete_cng, ocr, verbose):
-    print("Legend: ✅ = Converted | 🔤 = OCR | 🟦 = Already exists | ⏭️ = Skipped | ❌ = Failed\n")
-    print(f"Scanning directory tree under '{root}'... please wait")
-    t0 = time.time()
-    folders = fast_find_dirs(root)
-    print(f"Found {len(folders)} folders in {time.time() - t0:.2f} seconds.\n")
+def init_worker():
+    # Warm PIL's codec registry once per worker instead of on the first image.
+    Image.init()
 
+def run_batch(root, output_dir, jobs, delete_cng, ocr, verbose, io_threads=False, ocr_workers=1,
+              persist_jpg=True):
+    print("Legend: ✅ = Converted | 🔤 = OCR | 🟦 = Already exists | ⏭️ = Skipped | ❌ = Failed\n")
+    if verbose:
+        import PIL
+        if 'post' not in getattr(PIL, '__version__', ''):
+            print("[INFO] Scalar Pillow build detected; pillow-simd (AVX2) speeds up image decode/convert.")
     os.makedirs(output_dir, exist_ok=True)
-    with ThreadPoolExecutor(max_workers=jobs) as executor:
-        for i, folder in enumerate(folders):
-            executor.submit(process_folder, i, folder, len(folders), output_dir, delete_cng, ocr, verbose)
+    cache_path = os.path.join(output_dir, '.scan_cache.json')
+    issues = load_scan_cache(cache_path, root)
+    # One listdir of the output tells us every already-bound issue, so warm
+    # re-runs skip folders in O(1) without scheduling a worker or stat'ing
+    # the PDF. OCR runs still go through process_folder, which checks
+    # whether the existing PDF carries a text layer.
+    existing = set()
+    if not ocr:
+        try:
+            existing = {n for n in os.listdir(output_dir)
+                        if n.startswith('NGM_') and n.endswith('.pdf')}
+        except OSError:
+            pass
+    # Threads only make sense when the bottleneck is a network filesystem
+    # rather than the CPU; processes are the default for the decode-heavy path.
+    executor_cls = ThreadPoolExecutor if io_threads else ProcessPoolExecutor
+    executor_kwargs = {} if io_threads else {'initializer': init_worker}
+    with executor_cls(max_workers=jobs, **executor_kwargs) as executor:
+        futures = []
+        # Bound in-flight submissions so a huge archive doesn't queue (and
+        # pre-pickle) tens of thousands of tasks at once; the semaphore is
+        # released as workers finish, applying backpressure to the submit loop.
+        slots = threading.Semaphore(jobs * 2)
+
+        def submit(*task_args):
+            slots.acquire()
+            future = executor.submit(process_folder, *task_args)
+            future.add_done_callback(lambda _: slots.release())
+            futures.append(future)
+
+        try:
+            if issues is None:
+                # Submit folders as the walk discovers them so workers start
+                # while the scan is still running; the total isn't known yet.
+                print(f"Scanning directory tree under '{root}'... please wait")
+                t0 = time.time()
+                issues = []
+                for i, (folder, yyyymm) in enumerate(scan_issues(root)):
+                    issues.append((folder, yyyymm))
+                    if f'NGM_{yyyymm}.pdf' in existing:
+                        print_status(i, '?', os.path.basename(folder), SYMBOLS['exist'])
+                        continue
+                    submit(i, folder, '?', output_dir, delete_cng, ocr, verbose, yyyymm, ocr_workers,
+                           persist_jpg)
+                print(f"Found {len(issues)} issue folders in {time.time() - t0:.2f} seconds.\n")
+                save_scan_cache(cache_path, root, issues)
+            else:
+                print(f"Found {len(issues)} issue folders (cached scan).\n")
+                for i, (folder, yyyymm) in enumerate(issues):
+                    if f'NGM_{yyyymm}.pdf' in existing:
+                        print_status(i, len(issues), os.path.basename(folder), SYMBOLS['exist'])
+                        continue
+                    submit(i, folder, len(issues), output_dir, delete_cng, ocr, verbose, yyyymm,
+                           ocr_workers, persist_jpg)
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"[ERROR] Worker failed: {e}")
+        except KeyboardInterrupt:
+            executor.shutdown(cancel_futures=True)
+            raise
 
 def get_target_folder(rootdir, yyyymm):
     print(f"Looking for issue {yyyymm} in {rootdir}...")
     t0 = time.time()
     candidates = []
-    for path in Path(rootdir).rglob(f'{yyyymm}*'):
-        if path.is_dir():
-            candidates.append(str(path))
+    # Match directory names in memory; rglob would stat every file in the
+    # tree just to filter on the name prefix.
+    for dirpath, dirnames, _ in os.walk(rootdir):
+        for d in dirnames:
+            if d.startswith(yyyymm):
+                candidates.append(os.path.join(dirpath, d))
     if not candidates:
         print("No matching folders found.")
         sys.exit(1)
@@ -220,28 +627,47 @@ Examples:
     parser.add_argument('--dir', metavar='DIR', help='Bind images in this specific directory')
     parser.add_argument('--output', default=os.getcwd(), help='Output directory (default: current)')
     parser.add_argument('--jobs', type=int, default=2, help='Parallel workers (default: 2)')
+    parser.add_argument('--io-threads', action='store_true',
+                        help='Use threads instead of processes for batch workers (for network-FS-bound runs)')
     parser.add_argument('--ocr', action='store_true', help='Enable OCR for text-searchable PDF')
+    parser.add_argument('--ocr-workers', type=int, default=0,
+                        help='Parallel OCR pages per issue (default: cpu_count // jobs)')
+    parser.add_argument('--no-persist-jpg', action='store_true',
+                        help='Decode CNGs in memory instead of writing .jpg files (non-OCR runs only)')
     parser.add_argument('--remove', '-r', action='store_true', help='Delete CNGs after successful JPG conversion')
     parser.add_argument('--verbose', action='store_true', help='Print debug and info messages')
     parser.add_argument('src', nargs='?', help='Source folder root')
     parser.add_argument('yyyymm', nargs='?', help='Target issue date (e.g. 199412)')
     args = parser.parse_args()
 
+    # Size the per-issue OCR pool against the folder-level pool so the two
+    # layers of parallelism don't oversubscribe the machine.
+    ocr_workers = args.ocr_workers or max(1, (os.cpu_count() or 1) // max(1, args.jobs))
+
     if args.all:
-        run_batch(args.src, args.output, args.jobs, args.remove, args.ocr, args.verbose)
+        run_batch(args.src, args.output, args.jobs, args.remove, args.ocr, args.verbose,
+                  args.io_threads, ocr_workers, not args.no_persist_jpg)
     elif args.dir:
         folder = args.dir
         yyyymm = extract_yyyymm(folder)
         if not yyyymm:
             print(f"Invalid directory format: {folder}")
             sys.exit(1)
-        process_folder(0, folder, 1, args.output, args.remove, args.ocr, args.verbose)
+        process_folder(0, folder, 1, args.output, args.remove, args.ocr, args.verbose,
+                       ocr_workers=ocr_workers, persist_jpg=not args.no_persist_jpg)
     elif args.src and args.yyyymm:
         folder = get_target_folder(args.src, args.yyyymm)
-        process_folder(0, folder, 1, args.output, args.remove, args.ocr, args.verbose)
+        process_folder(0, folder, 1, args.output, args.remove, args.ocr, args.verbose,
+                       ocr_workers=ocr_workers, persist_jpg=not args.no_persist_jpg)
     else:
         parser.print_help()
 
 if __name__ == '__main__':
+    if sys.platform.startswith('linux'):
+        # Pay the fork+import cost once in the forkserver, not per worker.
+        try:
+            multiprocessing.set_start_method('forkserver')
+        except RuntimeError:
+            pass
     main()
 